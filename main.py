@@ -5,18 +5,23 @@ Analyzes which NBA rookies are providing the most (or least) value
 relative to their rookie-scale contracts.
 """
 
+import os
 import sys
+import numpy as np
 from src import config
-from src.features.build_dataset import build_historical_dataset, build_current_dataset
-from src.model.train import train_model, save_model
-from src.model.predict import calculate_residuals, export_residuals
-from src.model.diagnostics import validate_specific_players
-from src.display.residual_chart import create_residual_chart, create_summary_stats
-from src.display.accuracy_plot import create_prediction_accuracy_plot
 
 
 def main():
     """Run the complete analysis pipeline."""
+    # Imported here so the pipeline modules (nba_api, sklearn, matplotlib)
+    # only load when the analysis actually runs
+    from src.features.build_dataset import build_historical_dataset, build_current_dataset
+    from src.model.train import train_model, save_model
+    from src.model.predict import calculate_residuals, export_residuals
+    from src.model.diagnostics import validate_specific_players
+    from src.display.residual_chart import create_residual_chart, create_summary_stats
+    from src.display.accuracy_plot import create_prediction_accuracy_plot
+
     print("=" * 60)
     print("NBA ROOKIE CONTRACT VALUE ANALYSIS")
     print("=" * 60)
@@ -34,7 +39,7 @@ def main():
         return
 
     print(f"  Historical dataset: {len(historical_df)} rookies")
-    print(f"  Seasons: {config.HISTORICAL_SEASONS}")
+    print(f"  Seasons: {', '.join(config.HISTORICAL_SEASONS)}")
 
     # Step 2: Train model
     pipeline = train_model(historical_df)
@@ -58,13 +63,17 @@ def main():
     # Export residuals
     export_residuals(residuals_df, config.CURRENT_SEASON)
 
+    # CI/batch runs: no chart window and no prompts (stdin may be closed)
+    interactive = not os.environ.get('CI')
+
     # Step 5: Create visualization
     create_residual_chart(
         residuals_df,
         config.CURRENT_SEASON,
         figsize=config.CHART_FIGSIZE,
         surplus_color=config.SURPLUS_COLOR,
-        deficit_color=config.DEFICIT_COLOR
+        deficit_color=config.DEFICIT_COLOR,
+        show=interactive
     )
 
     # Step 6: Model accuracy diagnostics
@@ -76,69 +85,72 @@ def main():
 
     # Print top performers
     print("\n  Top 5 Surplus Value Rookies")
-    top_5 = residuals_df.head(5)
-    for _, row in top_5.iterrows():
-        print(f"  {row['PLAYER_NAME']:20s} ({row['team_abbrev']:3s}) | "
-              f"Pick {row['pick']:2.0f} | Residual: +{row['residual']:.2f}")
+    # residuals_df is sorted by residual (descending) in calculate_residuals
+    top_5 = residuals_df.iloc[:5]
+    for row in top_5.itertuples(index=False):
+        print(f"  {row.PLAYER_NAME:20s} ({row.team_abbrev:3s}) | "
+              f"Pick {row.pick:2.0f} | Residual: +{row.residual:.2f}")
 
     print("\n  Bottom 5 (Biggest Deficits) Rookies")
-    bottom_5 = residuals_df.tail(5).iloc[::-1]  # Reverse to show worst first
+    bottom_5 = residuals_df.iloc[-1:-6:-1]  # Last 5 reversed to show worst first
     bottom_5_names = []
-    for _, row in bottom_5.iterrows():
-        print(f"  {row['PLAYER_NAME']:20s} ({row['team_abbrev']:3s}) | "
-              f"Pick {row['pick']:2.0f} | Residual: {row['residual']:.2f}")
-        bottom_5_names.append(row['PLAYER_NAME'])
+    for row in bottom_5.itertuples(index=False):
+        print(f"  {row.PLAYER_NAME:20s} ({row.team_abbrev:3s}) | "
+              f"Pick {row.pick:2.0f} | Residual: {row.residual:.2f}")
+        bottom_5_names.append(row.PLAYER_NAME)
 
     # Prompt user for custom player breakdowns
-    print("\n=== Player Breakdown ===")
-
-    while True:
-        user_input = input("\nWould you like a detailed breakdown for any specific player(s)?\n"
-                           "Enter player name(s) separated by commas, or press Enter to skip: ").strip()
-
-        # If Enter, skip
-        if not user_input:
-            break
-
-        # Parse comma-separated names
-        player_names = [name.strip() for name in user_input.split(',') if name.strip()]
-
-        # If no valid names after parsing
-        if not player_names: 
-            print(f"\n  No valid player names provided.")
-            print(f"  Please try again or press Enter to skip.")
-            continue
-
-        # Check if any players match
-        found_any = False
-        for player_name in player_names:
-            matches = residuals_df[residuals_df['PLAYER_NAME'].str.contains(player_name, case=False, na=False)]
-            if not matches.empty:
-                found_any = True
+    if interactive:
+        print("\n=== Player Breakdown ===")
+
+        # Lowercased names for plain substring matching (no regex per lookup)
+        names_lower = residuals_df['PLAYER_NAME'].fillna('').str.lower().to_numpy(dtype=str)
+
+        while True:
+            user_input = input("\nWould you like a detailed breakdown for any specific player(s)?\n"
+                               "Enter player name(s) separated by commas, or press Enter to skip: ").strip()
+
+            # If Enter, skip
+            if not user_input:
                 break
 
-        if found_any:
-            # At least one player found, proceed with breakdown
-            validate_specific_players(residuals_df, player_names, historical_df)
-            break
-        else:
-            # No matches found, reprompt
-            print(f"\n  No players found matching: {', '.join(player_names)}")
-            print(f"  Please try again with different name(s) or press Enter to skip.")
+            # Parse comma-separated names
+            player_names = [name.strip() for name in user_input.split(',') if name.strip()]
+
+            # If no valid names after parsing
+            if not player_names: 
+                print(f"\n  No valid player names provided.")
+                print(f"  Please try again or press Enter to skip.")
+                continue
+
+            # Check if any players match
+            found_any = any(
+                (np.char.find(names_lower, player_name.lower()) >= 0).any()
+                for player_name in player_names
+            )
+
+            if found_any:
+                # At least one player found, proceed with breakdown
+                validate_specific_players(residuals_df, player_names, historical_df)
+                break
+            else:
+                # No matches found, reprompt
+                print(f"\n  No players found matching: {', '.join(player_names)}")
+                print(f"  Please try again with different name(s) or press Enter to skip.")
 
     print("\nANALYSIS COMPLETE")
-    first_season = config.HISTORICAL_SEASONS[0] if config.HISTORICAL_SEASONS else "none"
-    last_season = config.HISTORICAL_SEASONS[-1] if config.HISTORICAL_SEASONS else "none"
 
     print("\nOutputs:")
     print(f"  - outputs/{config.CURRENT_SEASON}_rookies_residuals.csv")
+    print(f"  - outputs/{config.CURRENT_SEASON}_rookies_residuals.parquet")
     print(f"  - outputs/{config.CURRENT_SEASON}_residual_bar_chart.png")
     print(f"  - outputs/{config.CURRENT_SEASON}_accuracy_diagnostic.png")
-    print(f"  - outputs/historical_data_{first_season}_to_{last_season}_for_{config.CURRENT_SEASON}.pkl (cached)")
+    print(f"  - outputs/historical/rookies_<season>_min{config.MIN_GAMES_PLAYED}.feather (cached per season)")
     print("  - outputs/model.pkl")
 
     # Keep matplotlib window open
-    input("\nPress Enter to exit and close chart...")
+    if interactive:
+        input("\nPress Enter to exit and close chart...")
 
 
 if __name__ == '__main__':
@@ -1,8 +1,10 @@
 """Configuration for NBA Rookie Contract Value Analysis."""
 
+import functools
 from datetime import datetime
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_season():
     """
     Automatically determine the current NBA season.
@@ -27,6 +29,7 @@ def get_current_season():
     return f"{start_year}-{str(end_year)[-2:]}"
 
 
+@functools.lru_cache(maxsize=32)
 def generate_historical_seasons(current_season, start_year=2019):
     """
     Generate list of historical seasons from start_year up to current season.
@@ -36,16 +39,12 @@ def generate_historical_seasons(current_season, start_year=2019):
         start_year: First year to include in historical data
 
     Returns:
-        List of season strings like ["2019-20", "2020-21", ...]
+        Tuple of season strings like ("2019-20", "2020-21", ...)
+        (immutable, since results are memoized and shared between callers)
     """
     current_start_year = int(current_season.split('-')[0])
-    seasons = []
 
-    for year in range(start_year, current_start_year):
-        end_year = year + 1
-        seasons.append(f"{year}-{str(end_year)[-2:]}")
-
-    return seasons
+    return tuple(f"{year}-{str(year + 1)[-2:]}" for year in range(start_year, current_start_year))
 
 
 # Current season to analyze (auto-detected)
@@ -64,6 +63,9 @@ VOLUME_METRIC = "MIN"
 # Minimum games played to include a rookie in analysis
 MIN_GAMES_PLAYED = 10
 
+# Print per-season fetch progress (errors and warnings are always printed)
+VERBOSE = False
+
 # Model settings
 MODEL_TYPE = "gradient_boosting"  # Best option for non-linear relationships
 CROSS_VALIDATION_FOLDS = 5
@@ -1,9 +1,11 @@
 """Create accuracy diagnostic scatter plot."""
 
-import matplotlib.pyplot as plt
 import numpy as np
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import os
+from ..model.diagnostics import fused_metrics
+
+# Above this many rookies, plot point density (hexbin) instead of individual markers
+HEXBIN_THRESHOLD = 2000
 
 
 def create_prediction_accuracy_plot(residuals_df, current_season, output_dir='outputs'):
@@ -17,83 +19,91 @@ def create_prediction_accuracy_plot(residuals_df, current_season, output_dir='ou
         current_season: Current season string
         output_dir: Directory to save plot
     """
-    actual = residuals_df['production'].values
-    predicted = residuals_df['expected_production'].values
+    # Deferred so importing this module doesn't pull in matplotlib
+    from matplotlib.figure import Figure
+
+    actual = residuals_df['production'].to_numpy(dtype=np.float64)
+    predicted = residuals_df['expected_production'].to_numpy(dtype=np.float64)
 
     # Calculate accuracy metrics
-    mae = mean_absolute_error(actual, predicted)
-    rmse = np.sqrt(mean_squared_error(actual, predicted))
-    r2 = r2_score(actual, predicted)
+    mae, rmse, r2, avg_production = fused_metrics(actual, predicted)
 
-    print(f"\n  Accuracy metrics:")
-    print(f"    Mean Absolute Error (MAE): {mae:.2f}")
-    print(f"    Root Mean Squared Error (RMSE): {rmse:.2f}")
-    print(f"    R² Score: {r2:.3f}")
+    # Collect the metrics report and write it once
+    lines = []
+    lines.append(f"\n  Accuracy metrics:")
+    lines.append(f"    Mean Absolute Error (MAE): {mae:.2f}")
+    lines.append(f"    Root Mean Squared Error (RMSE): {rmse:.2f}")
+    lines.append(f"    R² Score: {r2:.3f}")
 
-    print(f"\n  What these numbers mean:")
+    lines.append(f"\n  What these numbers mean:")
 
     # MAE interpretation
-    print(f"\n  MAE = {mae:.1f}")
-    print(f"    - On average, predictions are off by {mae:.1f} production units")
-    avg_production = actual.mean()
+    lines.append(f"\n  MAE = {mae:.1f}")
+    lines.append(f"    - On average, predictions are off by {mae:.1f} production units")
     mae_pct = (mae / avg_production) * 100
-    print(f"    - That's about {mae_pct:.1f}% error relative to average production ({avg_production:.1f})")
+    lines.append(f"    - That's about {mae_pct:.1f}% error relative to average production ({avg_production:.1f})")
     if mae < 20:
-        print(f"    ->  Excellent accuracy!")
+        lines.append(f"    ->  Excellent accuracy!")
     elif mae < 30:
-        print(f"    ->  Good accuracy")
+        lines.append(f"    ->  Good accuracy")
     else:
-        print(f"    ->  Moderate accuracy")
+        lines.append(f"    ->  Moderate accuracy")
 
     # RMSE interpretation
     rmse_mae_ratio = rmse / mae
-    print(f"\n  RMSE = {rmse:.1f}")
-    print(f"    - Similar to MAE but penalizes large errors more")
-    print(f"    - RMSE/MAE ratio = {rmse_mae_ratio:.2f}")
+    lines.append(f"\n  RMSE = {rmse:.1f}")
+    lines.append(f"    - Similar to MAE but penalizes large errors more")
+    lines.append(f"    - RMSE/MAE ratio = {rmse_mae_ratio:.2f}")
     if rmse_mae_ratio < 1.15:
-        print(f"    ->  Errors are consistent (few outliers)")
+        lines.append(f"    ->  Errors are consistent (few outliers)")
     elif rmse_mae_ratio < 1.4:
-        print(f"    ->  Some outlier predictions exist")
+        lines.append(f"    ->  Some outlier predictions exist")
     else:
-        print(f"    ->  Many large outlier errors (injuries/breakouts?)")
+        lines.append(f"    ->  Many large outlier errors (injuries/breakouts?)")
 
     # R² interpretation
-    print(f"\n  R² = {r2:.3f} ({r2*100:.1f}%)")
+    lines.append(f"\n  R² = {r2:.3f} ({r2*100:.1f}%)")
 
     if r2 < 0.3:
-        print(f"\n  Key finding: Salary alone is a weak predictor of rookie performance")
-        print(f"    - Salary explains only {max(0, r2*100):.1f}% of variance")
-        print(f"    - The remaining {100 - max(0, r2*100):.1f}% is due to other factors")
-        print(f"\n  What this means for the analysis:")
-        print(f"    - Residuals show how rookies compare to historical averages at their salary")
-        print(f"    - Not precise predictions, but useful benchmarks")
-        print(f"    - Surpluses/deficits reflect deviations from typical performance")
-        print(f"    - Interpretation: 'Better/worse than historical rookies at this price'")
-        print(f"\n  This tool evaluates production value relative to historical rookies")
-        print(f"  at the same salary, NOT absolute predictions of future performance.")
+        lines.append(f"\n  Key finding: Salary alone is a weak predictor of rookie performance")
+        lines.append(f"    - Salary explains only {max(0, r2*100):.1f}% of variance")
+        lines.append(f"    - The remaining {100 - max(0, r2*100):.1f}% is due to other factors")
+        lines.append(f"\n  What this means for the analysis:")
+        lines.append(f"    - Residuals show how rookies compare to historical averages at their salary")
+        lines.append(f"    - Not precise predictions, but useful benchmarks")
+        lines.append(f"    - Surpluses/deficits reflect deviations from typical performance")
+        lines.append(f"    - Interpretation: 'Better/worse than historical rookies at this price'")
+        lines.append(f"\n  This tool evaluates production value relative to historical rookies")
+        lines.append(f"  at the same salary, NOT absolute predictions of future performance.")
     elif r2 > 0.7:
-        print(f"    - Salary model explains {r2*100:.1f}% of variance in rookie production")
-        print(f"    ->  Excellent! Top-tier for sports analytics")
+        lines.append(f"    - Salary model explains {r2*100:.1f}% of variance in rookie production")
+        lines.append(f"    ->  Excellent! Top-tier for sports analytics")
     elif r2 > 0.6:
-        print(f"    - Salary model explains {r2*100:.1f}% of variance in rookie production")
-        print(f"    ->  Salary is a good predictor.")
+        lines.append(f"    - Salary model explains {r2*100:.1f}% of variance in rookie production")
+        lines.append(f"    ->  Salary is a good predictor.")
     elif r2 > 0.5:
-        print(f"    - Salary model explains {r2*100:.1f}% of variance in rookie production")
-        print(f"    ->  Salary is a moderate predictor.")
+        lines.append(f"    - Salary model explains {r2*100:.1f}% of variance in rookie production")
+        lines.append(f"    ->  Salary is a moderate predictor.")
     else:
-        print(f"    - Salary model explains {r2*100:.1f}% of variance in rookie production")
-        print(f"    ->  Salary is a weak predictor.")
+        lines.append(f"    - Salary model explains {r2*100:.1f}% of variance in rookie production")
+        lines.append(f"    ->  Salary is a weak predictor.")
 
-    # Create scatter plot
-    fig, ax = plt.subplots(figsize=(10, 10))
+    print('\n'.join(lines))
 
-    # Plot points
-    ax.scatter(predicted, actual, alpha=0.6, s=100, edgecolors='black', linewidth=0.5)
+    # Create scatter plot (a bare Figure renders with Agg, no GUI backend needed)
+    fig = Figure(figsize=(10, 10))
+    ax = fig.subplots()
 
-    # Add perfect prediction line (y=x)
-    max_val = max(actual.max(), predicted.max())
-    min_val = min(actual.min(), predicted.min())
-    ax.plot([min_val, max_val], [min_val, max_val], 'r--', linewidth=2, label='Perfect Prediction')
+    if len(actual) > HEXBIN_THRESHOLD:
+        # Too many markers to draw individually; bin them into hexagons instead
+        hb = ax.hexbin(predicted, actual, gridsize=50, mincnt=1, cmap='viridis')
+        fig.colorbar(hb, ax=ax, label='Rookies per bin')
+    else:
+        # Plot points (rasterized so vector outputs don't store a path per point)
+        ax.scatter(predicted, actual, alpha=0.6, s=100, edgecolors='black', linewidth=0.5, rasterized=True)
+
+    # Add perfect prediction line (y=x), spanning the axes without changing their limits
+    ax.axline((0, 0), slope=1, color='r', linestyle='--', linewidth=2, label='Perfect Prediction')
 
     # Add labels
     ax.set_xlabel('Expected Production (Model Prediction)', fontsize=12, fontweight='bold')
@@ -114,13 +124,11 @@ def create_prediction_accuracy_plot(residuals_df, current_season, output_dir='ou
     # Equal aspect ratio
     ax.set_aspect('equal', adjustable='box')
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save
     output_path = os.path.join(output_dir, f'{current_season}_accuracy_diagnostic.png')
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    fig.savefig(output_path, dpi=300, bbox_inches='tight')
     print(f"\n  Accuracy diagnostic saved to {output_path}")
 
-    plt.close(fig)  # Close without displaying
-
     return fig
@@ -1,11 +1,10 @@
 """Create residual value bar chart visualization."""
 
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 
 
-def create_residual_chart(residuals_df, current_season, output_path=None, figsize=(12, 16), surplus_color='#2ecc71', deficit_color='#e74c3c'):
+def create_residual_chart(residuals_df, current_season, output_path=None, figsize=(12, 16), surplus_color='#2ecc71', deficit_color='#e74c3c', show=True):
     """
     Create horizontal bar chart showing residual values.
 
@@ -16,10 +15,14 @@ def create_residual_chart(residuals_df, current_season, output_path=None, figsiz
         figsize: Figure size
         surplus_color: Green for positive residuals 
         deficit_color: Red for negative residuals 
+        show: Display the chart window (False = only save the PNG)
 
     Returns:
         Figure object
     """
+    # Deferred so importing this module doesn't initialize a GUI backend
+    import matplotlib.pyplot as plt
+
     if output_path is None:
         output_path = f'outputs/{current_season}_residual_bar_chart.png'
     print("\nCreating residual chart...")
@@ -30,15 +33,17 @@ def create_residual_chart(residuals_df, current_season, output_path=None, figsiz
     # Create labels with player name and team
     df['label'] = df['PLAYER_NAME'] + ' (' + df['team_abbrev'] + ')'
 
-    # Determine colors based on residual sign
-    colors = [surplus_color if r > 0 else deficit_color for r in df['residual']]
+    # Determine colors based on residual sign (sign is reused for annotations)
+    residuals = df['residual'].to_numpy()
+    is_surplus = residuals > 0
+    colors = np.where(is_surplus, surplus_color, deficit_color)
 
     # Create figure
     fig, ax = plt.subplots(figsize=figsize)
 
     # Create horizontal bar chart
     y_pos = np.arange(len(df))
-    bars = ax.barh(y_pos, df['residual'], color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
+    bars = ax.barh(y_pos, residuals, color=colors, alpha=0.8, edgecolor='black', linewidth=0.5)
 
     # Add vertical line at x=0 (expected value)
     ax.axvline(x=0, color='black', linestyle='-', linewidth=2, label='Expected Value')
@@ -53,13 +58,11 @@ def create_residual_chart(residuals_df, current_season, output_path=None, figsiz
     ax.grid(axis='x', alpha=0.3, linestyle='--')
 
     # Add text annotations for players
-    for idx, (i, row) in enumerate(df.iterrows()):
-        residual = row['residual']
-        # Position text to the right of positive bars, left of negative bars
-        if residual > 0:
-            ax.text(residual, idx, f'  +{residual:.1f}', va='center', fontsize=8, fontweight='bold')
-        else:
-            ax.text(residual, idx, f'  {residual:.1f}', va='center', ha='right', fontsize=8, fontweight='bold')
+    # Position text to the right of positive bars, left of negative bars
+    alignments = np.where(is_surplus, 'left', 'right')
+    prefixes = np.where(is_surplus, '  +', '  ')
+    for idx, (residual, ha, prefix) in enumerate(zip(residuals, alignments, prefixes)):
+        ax.text(residual, idx, f'{prefix}{residual:.1f}', va='center', ha=ha, fontsize=8, fontweight='bold')
 
     # Add legend
     from matplotlib.patches import Patch
@@ -74,11 +77,15 @@ def create_residual_chart(residuals_df, current_season, output_path=None, figsiz
 
     # Save figure
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=150, bbox_inches='tight')
 
-    # Display the chart
-    plt.show(block=False)
-    plt.pause(0.1)
+    if show:
+        # Display the chart
+        plt.show(block=False)
+        plt.pause(0.1)
+    else:
+        # Nothing will display it, so release the figure now
+        plt.close(fig)
 
     return fig
 
@@ -93,14 +100,16 @@ def create_summary_stats(residuals_df):
     Returns:
         Dictionary with summary stats
     """
+    residuals = residuals_df['residual'].to_numpy()
+
     stats = {
-        'total_rookies': len(residuals_df),
-        'surplus_rookies': len(residuals_df[residuals_df['residual'] > 0]),
-        'deficit_rookies': len(residuals_df[residuals_df['residual'] < 0]),
-        'max_surplus': residuals_df['residual'].max(),
-        'max_deficit': residuals_df['residual'].min(),
-        'mean_residual': residuals_df['residual'].mean(),
-        'median_residual': residuals_df['residual'].median(),
+        'total_rookies': residuals.size,
+        'surplus_rookies': int((residuals > 0).sum()),
+        'deficit_rookies': int((residuals < 0).sum()),
+        'max_surplus': residuals.max(),
+        'max_deficit': residuals.min(),
+        'mean_residual': residuals.mean(),
+        'median_residual': float(np.median(residuals)),
     }
 
     print("\n=== Current Season Summary Statistics ===")
@@ -3,10 +3,30 @@
 import pandas as pd
 import numpy as np
 import os
-import pickle
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from ..fetch.cache import write_feather
 from ..fetch.nba_stats import fetch_player_stats, fetch_advanced_stats, combine_stats
 from ..fetch.rookies import fetch_rookie_stats
-from ..fetch.salaries import load_rookie_scale_salaries, adjust_salary_for_inflation
+from ..fetch.salaries import load_rookie_scale_salaries, inflation_factor
+
+# Per-season cache of fetched historical rookie stats
+HISTORICAL_CACHE_DIR = os.path.join('outputs', 'historical')
+
+# Concurrent season fetches (in-flight API requests are capped separately by
+# fetch.cache.API_REQUEST_SLOTS, since each season issues several requests)
+MAX_FETCH_WORKERS = 4
+
+# Dtypes for the final datasets: compact integer counts, full-precision
+# measurements (these are exported as-is to the residuals CSV)
+_DTYPES = {
+    'pick': 'int16',
+    'GP': 'int16',
+    'MIN': 'float64',
+    'PIE': 'float64',
+    'production': 'float64',
+    'salary': 'float64',
+}
 
 
 def compute_production(df, target_metric='PIE', volume_metric='MIN'):
@@ -22,10 +42,11 @@ def compute_production(df, target_metric='PIE', volume_metric='MIN'):
         DataFrame with 'production' column added
     """
     # PIE is a percentage, so multiply by minutes
-    df['production'] = df[target_metric] * df[volume_metric]
+    production = df[target_metric].to_numpy(dtype=np.float64) * df[volume_metric].to_numpy(dtype=np.float64)
 
-    # Handle missing values
-    df['production'] = df['production'].fillna(0)
+    # Handle missing values (in place, no second column pass)
+    np.nan_to_num(production, nan=0.0, copy=False)
+    df['production'] = production
 
     return df
 
@@ -41,78 +62,131 @@ def add_salary_info(rookies_df, salary_scale_df):
     Returns:
         DataFrame with salary column
     """
-    # Merge salary info based on draft pick (inner join = only keep drafted)
-    result = rookies_df.merge(
-        salary_scale_df,
-        on='pick',
-        how='inner'
-    )
+    # Look up salary by draft pick (scale is small, so a dict beats a merge)
+    salary_map = dict(zip(salary_scale_df['pick'].to_numpy(), salary_scale_df['salary'].to_numpy()))
+    result = rookies_df.assign(salary=rookies_df['pick'].map(salary_map))
+
+    # Drop picks without a scale salary (same rows an inner join would drop)
+    result = result.dropna(subset=['salary'])
 
     return result
 
 
-def build_historical_dataset(seasons, current_season, min_games=10):
+def _load_season_stats(season, min_games):
     """
-    Build a dataset of historical rookies with production and salary.
-    Salaries are inflation-adjusted (~2% annually) to current_season dollars.
+    Load one historical season of rookie stats, fetching it only if it isn't cached.
 
-    Uses caching to avoid re-fetching data on subsequent runs.
-    Cache is invalidated if historical seasons list or current season changes.
+    Each season is cached on its own (before salary is attached) so that
+    changing the historical range or the current season never refetches
+    seasons that are already on disk.
 
     Args:
-        seasons: List of season strings (e.g., ["2019-20", "2020-21"])
-        current_season: Current season string for inflation adjustment (e.g., "2025-26")
-        min_games: Minimum games played threshold 
+        season: Season string (e.g., "2019-20")
+        min_games: Minimum games played threshold
 
     Returns:
-        DataFrame with columns: player_name, season, pick, salary, production
+        DataFrame with rookie stats and production, or an empty DataFrame if no rookies were found
     """
-    # Check for cached historical data
-    first_season = seasons[0] if seasons else "none"
-    last_season = seasons[-1] if seasons else "none"
-    cache_file = f'outputs/historical_data_{first_season}_to_{last_season}_for_{current_season}.pkl'
+    cache_file = os.path.join(HISTORICAL_CACHE_DIR, f'rookies_{season}_min{min_games}.feather')
 
     if os.path.exists(cache_file):
-        with open(cache_file, 'rb') as f:
-            dataset = pickle.load(f)
-        return dataset
+        return pd.read_feather(cache_file)
 
-    all_rookies = []
+    # Fetch rookie stats
+    rookies = fetch_rookie_stats(
+        season,
+        fetch_player_stats,
+        fetch_advanced_stats,
+        combine_stats,
+        min_games=min_games
+    )
 
-    # Load salary scale
-    salary_scale = load_rookie_scale_salaries(current_season)
+    if rookies.empty:
+        return rookies
 
-    for season in seasons:
-        # Fetch rookie stats
-        rookies = fetch_rookie_stats(
-            season,
-            fetch_player_stats,
-            fetch_advanced_stats,
-            combine_stats,
-            min_games=min_games
-        )
+    # Compute production metric
+    rookies = compute_production(rookies)
 
-        if rookies.empty:
-            continue
+    # Select key columns (salary is added at load time)
+    rookies = rookies[[
+        'PLAYER_NAME', 'SEASON', 'pick', 'production',
+        'GP', 'MIN', 'PIE', 'team_abbrev'
+    ]].reset_index(drop=True)
+
+    # Save to cache for future runs (Feather/Arrow IPC: no decode step on read)
+    os.makedirs(HISTORICAL_CACHE_DIR, exist_ok=True)
+    write_feather(rookies, cache_file)
 
-        # Compute production metric
-        rookies = compute_production(rookies)
+    return rookies
 
-        # Add salary info
-        rookies = add_salary_info(rookies, salary_scale)
 
-        # Adjust salary for inflation (~2% annually) to current season dollars
-        rookies['salary'] = rookies['salary'].apply(
-            lambda x: adjust_salary_for_inflation(x, season, current_season)
-        )
+def _process_season(season, salary_scale, current_season, min_games):
+    """
+    Prepare one historical season of rookies with inflation-adjusted salary.
 
-        # Select key columns
-        rookies = rookies[[
-            'PLAYER_NAME', 'SEASON', 'pick', 'salary', 'production',
-            'GP', 'MIN', 'PIE', 'team_abbrev'
-        ]].copy()
+    Args:
+        season: Season string (e.g., "2019-20")
+        salary_scale: DataFrame with pick -> salary mapping
+        current_season: Current season string for inflation adjustment
+        min_games: Minimum games played threshold
 
-        all_rookies.append(rookies)
+    Returns:
+        DataFrame with key columns, or an empty DataFrame if no rookies were found
+    """
+    rookies = _load_season_stats(season, min_games)
+
+    if rookies.empty:
+        return rookies
+
+    # Add salary info
+    rookies = add_salary_info(rookies, salary_scale)
+
+    # Adjust salary for inflation (~2% annually) to current season dollars
+    # (one factor per season, applied to the whole column)
+    factor = inflation_factor(season, current_season)
+    rookies['salary'] = rookies['salary'].to_numpy() * factor
+
+    # Select key columns and downcast numerics
+    rookies = rookies.loc[:, [
+        'PLAYER_NAME', 'SEASON', 'pick', 'salary', 'production',
+        'GP', 'MIN', 'PIE', 'team_abbrev'
+    ]].astype(_DTYPES)
+
+    return rookies
+
+
+def build_historical_dataset(seasons, current_season, min_games=10):
+    """
+    Build a dataset of historical rookies with production and salary.
+    Salaries are inflation-adjusted (~2% annually) to current_season dollars.
+
+    Uses a per-season cache (outputs/historical/) so only seasons that have
+    never been fetched hit the NBA API. Salary and inflation are applied after
+    loading, so a new current season or start year reuses the cached seasons.
+
+    Args:
+        seasons: List of season strings (e.g., ["2019-20", "2020-21"])
+        current_season: Current season string for inflation adjustment (e.g., "2025-26")
+        min_games: Minimum games played threshold 
+
+    Returns:
+        DataFrame with columns: player_name, season, pick, salary, production
+    """
+    # Load salary scale
+    salary_scale = load_rookie_scale_salaries(current_season)
+
+    # Seasons are independent and fetching is network-bound, so overlap them.
+    # map() keeps results in season order. A partial of the module-level
+    # worker (not a lambda) stays picklable if this moves to a process pool.
+    process_season = partial(
+        _process_season,
+        salary_scale=salary_scale,
+        current_season=current_season,
+        min_games=min_games
+    )
+    with ThreadPoolExecutor(max_workers=max(1, min(len(seasons), MAX_FETCH_WORKERS))) as executor:
+        results = executor.map(process_season, seasons)
+        all_rookies = [rookies for rookies in results if not rookies.empty]
 
     # Combine all seasons
     if not all_rookies:
@@ -120,10 +194,10 @@ def build_historical_dataset(seasons, current_season, min_games=10):
 
     dataset = pd.concat(all_rookies, ignore_index=True)
 
-    # Save to cache for future runs
-    os.makedirs('outputs', exist_ok=True)
-    with open(cache_file, 'wb') as f:
-        pickle.dump(dataset, f)
+    # Low-cardinality labels: store as integer codes instead of repeated strings
+    for col in ('SEASON', 'team_abbrev'):
+        dataset[col] = dataset[col].astype('category')
+
     return dataset
 
 
@@ -159,10 +233,10 @@ def build_current_dataset(season, min_games=10):
     # Add salary info
     rookies = add_salary_info(rookies, salary_scale)
 
-    # Select key columns
-    rookies = rookies[[
+    # Select key columns and downcast numerics
+    rookies = rookies.loc[:, [
         'PLAYER_NAME', 'SEASON', 'pick', 'salary', 'production',
         'GP', 'MIN', 'PIE', 'team_abbrev'
-    ]].copy()
+    ]].astype(_DTYPES)
 
     return rookies
@@ -0,0 +1,85 @@
+"""On-disk cache and shared request limit for NBA API calls."""
+
+import functools
+import inspect
+import os
+import re
+import tempfile
+import threading
+import pandas as pd
+from .. import config
+
+# Raw API responses, one Feather file per (endpoint, season, parameters)
+API_CACHE_DIR = os.path.join('outputs', 'api_cache')
+
+# Shared cap on in-flight stats.nba.com requests across every fetch thread
+# (the host blocks aggressive clients). A slot is held through the request
+# and its rate-limit sleep, so this also bounds the total request rate.
+MAX_CONCURRENT_REQUESTS = 4
+API_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def write_feather(df, path):
+    """
+    Write a DataFrame to Feather (lz4) atomically.
+
+    The frame is written to a temporary file in the same directory and then
+    moved into place, so an interrupted run never leaves a truncated cache
+    file behind.
+
+    Args:
+        df: DataFrame with a default RangeIndex
+        path: Destination .feather file
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        df.to_feather(tmp_path, compression='lz4')
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def cached_response(endpoint):
+    """
+    Cache a season fetcher's DataFrame on disk.
+
+    Only completed seasons (before config.CURRENT_SEASON) are cached, since
+    their stats and draft results no longer change. The current season is
+    always fetched fresh. Empty results (failed requests) are not cached.
+
+    Args:
+        endpoint: Name used in the cache filename (e.g., "leaguedashplayerstats_base")
+
+    Returns:
+        Decorator for functions taking a season string as their first argument
+    """
+    def decorator(fetcher):
+        signature = inspect.signature(fetcher)
+
+        @functools.wraps(fetcher)
+        def wrapper(season, *args, **kwargs):
+            if season >= config.CURRENT_SEASON:
+                return fetcher(season, *args, **kwargs)
+
+            # Key on every argument, including defaults (e.g., season_type)
+            bound = signature.bind(season, *args, **kwargs)
+            bound.apply_defaults()
+            key = '_'.join([endpoint] + [str(value) for value in bound.arguments.values()])
+            cache_file = os.path.join(API_CACHE_DIR, re.sub(r'[^\w.-]+', '-', key) + '.feather')
+
+            if os.path.exists(cache_file):
+                return pd.read_feather(cache_file)
+
+            df = fetcher(season, *args, **kwargs)
+
+            if not df.empty:
+                os.makedirs(API_CACHE_DIR, exist_ok=True)
+                write_feather(df.reset_index(drop=True), cache_file)
+
+            return df
+
+        return wrapper
+
+    return decorator
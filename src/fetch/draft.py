@@ -3,8 +3,11 @@
 import pandas as pd
 from nba_api.stats.endpoints import drafthistory
 import time
+from .cache import cached_response, API_REQUEST_SLOTS
+from .. import config
 
 
+@cached_response('drafthistory')
 def fetch_draft_class(season):
     """
     Fetch draft data for a given season.
@@ -18,14 +21,18 @@ def fetch_draft_class(season):
     # Extract the draft year from season (e.g., "2025-26" -> 2025)
     draft_year = int(season.split('-')[0])
 
-    print(f"Processing {draft_year} draft...")
+    if config.VERBOSE:
+        print(f"Processing {draft_year} draft...")
 
     try:
-        # Fetch all draft history
-        draft = drafthistory.DraftHistory(
-            season_year_nullable=str(draft_year),
-            timeout=60
-        )
+        with API_REQUEST_SLOTS:
+            # Fetch all draft history
+            draft = drafthistory.DraftHistory(
+                season_year_nullable=str(draft_year),
+                timeout=60
+            )
+
+            time.sleep(0.6)
 
         df = draft.get_data_frames()[0]
 
@@ -42,9 +49,8 @@ def fetch_draft_class(season):
         df = df[['player_id', 'player_name', 'pick', 'team', 'team_abbrev']].copy()
         df['draft_year'] = draft_year
 
-        print(f"  Retrieved {len(df)} draft picks from {draft_year}")
-
-        time.sleep(0.6)
+        if config.VERBOSE:
+            print(f"  Retrieved {len(df)} draft picks from {draft_year}")
 
         return df
 
@@ -4,8 +4,11 @@ import time
 import pandas as pd
 from nba_api.stats.endpoints import leaguedashplayerstats
 from nba_api.stats.library.parameters import SeasonType
+from .cache import cached_response, API_REQUEST_SLOTS
+from .. import config
 
 
+@cached_response('leaguedashplayerstats_base')
 def fetch_player_stats(season, season_type=SeasonType.regular):
     """
     Fetch player stats for a given season.
@@ -15,28 +18,32 @@ def fetch_player_stats(season, season_type=SeasonType.regular):
         season_type: Regular season or playoffs
 
     Returns:
-        DataFrame with player stats including PIE, minutes, etc.
+        DataFrame with player ID, name, games played, minutes and season
     """
-    print(f"\nProcessing player stats for {season}...")
+    if config.VERBOSE:
+        print(f"\nProcessing player stats for {season}...")
 
     try:
-        # Fetch traditional stats
-        stats = leaguedashplayerstats.LeagueDashPlayerStats(
-            season=season,
-            season_type_all_star=season_type,
-            per_mode_detailed='Totals',
-            timeout=60
-        )
-
-        # Get the dataframe
+        with API_REQUEST_SLOTS:
+            # Fetch traditional stats
+            stats = leaguedashplayerstats.LeagueDashPlayerStats(
+                season=season,
+                season_type_all_star=season_type,
+                per_mode_detailed='Totals',
+                timeout=60
+            )
+
+            # Rate limit to NBA API
+            time.sleep(0.6)
+
+        # Get the dataframe, keeping only the columns used downstream
+        # (team comes from the draft data)
         df = stats.get_data_frames()[0]
+        df = df[['PLAYER_ID', 'PLAYER_NAME', 'GP', 'MIN']].copy()
 
         # Add season column
         df['SEASON'] = season
 
-        # Rate limit to NBA API
-        time.sleep(0.6)
-
         return df
 
     except Exception as e:
@@ -44,6 +51,7 @@ def fetch_player_stats(season, season_type=SeasonType.regular):
         return pd.DataFrame()
 
 
+@cached_response('leaguedashplayerstats_advanced')
 def fetch_advanced_stats(season, season_type=SeasonType.regular):
     """
     Fetch Player Impact Estimate (PIE).
@@ -53,24 +61,27 @@ def fetch_advanced_stats(season, season_type=SeasonType.regular):
         season_type: Regular season or playoffs
 
     Returns:
-        DataFrame with advanced stats
+        DataFrame with player ID, PIE and season
     """
-    print(f"Processing advanced stats for {season}...")
+    if config.VERBOSE:
+        print(f"Processing advanced stats for {season}...")
 
     try:
-        stats = leaguedashplayerstats.LeagueDashPlayerStats(
-            season=season,
-            season_type_all_star=season_type,
-            per_mode_detailed='Totals',
-            measure_type_detailed_defense='Advanced',
-            timeout=60
-        )
+        with API_REQUEST_SLOTS:
+            stats = leaguedashplayerstats.LeagueDashPlayerStats(
+                season=season,
+                season_type_all_star=season_type,
+                per_mode_detailed='Totals',
+                measure_type_detailed_defense='Advanced',
+                timeout=60
+            )
+
+            time.sleep(0.6)
 
         df = stats.get_data_frames()[0]
+        df = df[['PLAYER_ID', 'PIE']].copy()
         df['SEASON'] = season
 
-        time.sleep(0.6)
-
         return df
 
     except Exception as e:
@@ -89,15 +100,9 @@ def combine_stats(base_df, advanced_df):
     Returns:
         Combined DataFrame
     """
-    # Select key columns from advanced stats
-    advanced_cols = ['PLAYER_ID', 'SEASON', 'PIE']
-    advanced_subset = advanced_df[advanced_cols]
-
-    # Merge on player ID and season
-    combined = base_df.merge(
-        advanced_subset,
-        on=['PLAYER_ID', 'SEASON'],
-        how='left'
-    )
+    # Both frames come from the same season, so PLAYER_ID alone is the key.
+    # Look up PIE by player ID (like a left join, missing players get NaN)
+    pie_map = dict(zip(advanced_df['PLAYER_ID'].to_numpy(), advanced_df['PIE'].to_numpy()))
+    combined = base_df.assign(PIE=base_df['PLAYER_ID'].map(pie_map))
 
     return combined
@@ -1,7 +1,9 @@
 """Identify and fetch rookie player data."""
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from .draft import fetch_draft_class, get_rookie_player_stats_draft
+from .. import config
 
 
 def fetch_rookie_stats(season, base_fetcher, advanced_fetcher, combiner, min_games=10):
@@ -20,9 +22,14 @@ def fetch_rookie_stats(season, base_fetcher, advanced_fetcher, combiner, min_gam
     Returns:
         DataFrame with rookie regular season stats, draft pick, and team info
     """
-    # Fetch all player stats for the season
-    base_stats = base_fetcher(season) # Player info, games, minutes, team
-    advanced_stats = advanced_fetcher(season) # Player impact estimate (PIE)
+    # Fetch all player stats for the season. The two requests are independent,
+    # so run them together and overlap their network waits and rate-limit sleeps.
+    # Total in-flight requests stay capped by the shared API_REQUEST_SLOTS.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        base_future = executor.submit(base_fetcher, season) # Player info, games, minutes
+        advanced_future = executor.submit(advanced_fetcher, season) # Player impact estimate (PIE)
+        base_stats = base_future.result()
+        advanced_stats = advanced_future.result()
 
     if base_stats.empty or advanced_stats.empty:
         return pd.DataFrame()
@@ -43,6 +50,7 @@ def fetch_rookie_stats(season, base_fetcher, advanced_fetcher, combiner, min_gam
     # Filter by minimum games played
     rookies = rookies[rookies['GP'] >= min_games].copy()
 
-    print(f"  {len(rookies)} rookies with {min_games}+ games")
+    if config.VERBOSE:
+        print(f"  {len(rookies)} rookies with {min_games}+ games")
 
     return rookies
@@ -1,13 +1,18 @@
 """Load and process rookie salary data."""
 
+import functools
 import pandas as pd
 import os
 
 
+@functools.lru_cache(maxsize=None)
 def load_rookie_scale_salaries(season, data_dir='data'):
     """
     Load rookie scale salaries from CSV file and calculate 4-year average.
 
+    Results are memoized per (season, data_dir); callers must treat the
+    returned DataFrame as read-only.
+
     Expected CSV format:
     pick,salary_year1,salary_year2,salary_year3,salary_year4
 
@@ -49,18 +54,17 @@ def load_rookie_scale_salaries(season, data_dir='data'):
     return df
 
 
-def adjust_salary_for_inflation(salary, from_season, to_season, annual_rate=0.02):
+def inflation_factor(from_season, to_season, annual_rate=0.02):
     """
-    Adjust salary for inflation to compare historical contracts.
+    Compound inflation multiplier between two seasons.
 
     Args:
-        salary: Original salary amount
         from_season: Season string like "2019-20"
         to_season: Season string like "2025-26"
         annual_rate: Annual inflation rate (default 2%)
 
     Returns:
-        Inflation-adjusted salary in to_season dollars
+        Multiplier that converts from_season dollars to to_season dollars
     """
     # Extract year from season strings
     from_year = int(from_season.split('-')[0])
@@ -68,7 +72,23 @@ def adjust_salary_for_inflation(salary, from_season, to_season, annual_rate=0.02
 
     years_diff = to_year - from_year
 
+    return (1 + annual_rate) ** years_diff
+
+
+def adjust_salary_for_inflation(salary, from_season, to_season, annual_rate=0.02):
+    """
+    Adjust salary for inflation to compare historical contracts.
+
+    Args:
+        salary: Original salary amount (scalar or array)
+        from_season: Season string like "2019-20"
+        to_season: Season string like "2025-26"
+        annual_rate: Annual inflation rate (default 2%)
+
+    Returns:
+        Inflation-adjusted salary in to_season dollars
+    """
     # Apply compound inflation adjustment
-    adjusted_salary = salary * ((1 + annual_rate) ** years_diff)
+    adjusted_salary = salary * inflation_factor(from_season, to_season, annual_rate)
 
     return adjusted_salary
@@ -1,107 +1,166 @@
-"""Model diagnostics - player validation and text-based reporting."""
+"""Model diagnostics - accuracy metrics, player validation and text-based reporting."""
 
 import pandas as pd
+import numpy as np
 from .. import config
 
 
-def validate_specific_players(residuals_df, player_names, historical_df=None):
+def fused_metrics(actual, predicted):
+    """
+    Compute MAE, RMSE and R² from a single error array.
+
+    Args:
+        actual: Array of actual production values
+        predicted: Array of predicted production values
+
+    Returns:
+        Tuple of (mae, rmse, r2, actual_mean)
+    """
+    # Contiguous float64 so every reduction stays on NumPy's fast path
+    actual = np.ascontiguousarray(actual, dtype=np.float64)
+    predicted = np.ascontiguousarray(predicted, dtype=np.float64)
+
+    diff = actual - predicted
+    actual_mean = actual.mean()
+    ss_res = diff @ diff
+    ss_tot = ((actual - actual_mean) ** 2).sum()
+
+    mae = np.abs(diff).mean()
+    rmse = np.sqrt(ss_res / diff.size)
+    if ss_tot > 0:
+        r2 = 1 - ss_res / ss_tot
+    else:
+        # Constant actual values: perfect predictions score 1.0, anything else 0.0 (as sklearn)
+        r2 = 1.0 if ss_res == 0 else 0.0
+
+    return mae, rmse, r2, actual_mean
+
+
+def validate_specific_players(residuals_df, player_names, historical_df=None, exact=True):
     """
     Show detailed breakdown for specific players to validate residuals.
 
     Args:
         residuals_df: DataFrame with all rookie data
         player_names: List of player names to check
+        historical_df: Optional DataFrame of historical rookies for salary comparisons
+        exact: Look names up by exact match first (misses fall back to substring search)
     """
-    for player_name in player_names:
-        # Find player
-        matches = residuals_df[residuals_df['PLAYER_NAME'].str.contains(player_name, case=False, na=False)]
-
-        if matches.empty:
-            print(f"\n{'='*60}")
-            print(f"=== {player_name} Validation ===")
-            print(f"{'='*60}")
-            print(f"  Player not found: {player_name}")
+    # Collect the report and write it once at the end
+    lines = []
+
+    # Lowercased names for plain substring matching (no regex per lookup)
+    names_lower = residuals_df['PLAYER_NAME'].fillna('').str.lower().to_numpy(dtype=str)
+
+    # Exact matches for all requested names at once via a hashed Index (first row per name)
+    exact_positions = np.full(len(player_names), -1)
+    if exact:
+        names = residuals_df['PLAYER_NAME']
+        first_rows = np.flatnonzero(~names.duplicated().to_numpy())
+        found = pd.Index(names.to_numpy()[first_rows]).get_indexer(player_names)
+        hit = found >= 0
+        exact_positions[hit] = first_rows[found[hit]]
+
+    # Sort historical rookies by salary once so each salary band is a binary search
+    if historical_df is not None:
+        hist_sorted = historical_df.sort_values('salary').reset_index(drop=True)
+        hist_salaries = hist_sorted['salary'].to_numpy()
+        hist_production = hist_sorted['production'].to_numpy()
+
+    for player_name, position in zip(player_names, exact_positions):
+        # Find player: exact match if found, otherwise substring search
+        if position < 0:
+            match_positions = np.flatnonzero(np.char.find(names_lower, player_name.lower()) >= 0)
+            position = match_positions[0] if match_positions.size > 0 else -1
+
+        if position < 0:
+            lines.append(f"\n{'='*60}")
+            lines.append(f"=== {player_name} Validation ===")
+            lines.append(f"{'='*60}")
+            lines.append(f"  Player not found: {player_name}")
             continue
 
-        player = matches.iloc[0]
+        player = residuals_df.iloc[position]
 
-        print(f"{player['PLAYER_NAME']}")
-        print(f"Team: {player['team_abbrev']}")
-        print(f"Draft Pick: #{player['pick']:.0f}")
+        lines.append(f"{player['PLAYER_NAME']}")
+        lines.append(f"Team: {player['team_abbrev']}")
+        lines.append(f"Draft Pick: #{player['pick']:.0f}")
 
-        print(f"\n  Stats:")
-        print(f"  Games Played: {player['GP']:.0f}")
-        print(f"  Total Minutes: {player['MIN']:.0f}")
-        print(f"  Player Impact Estimate (PIE): {player['PIE']:.3f}")
+        lines.append(f"\n  Stats:")
+        lines.append(f"  Games Played: {player['GP']:.0f}")
+        lines.append(f"  Total Minutes: {player['MIN']:.0f}")
+        lines.append(f"  Player Impact Estimate (PIE): {player['PIE']:.3f}")
 
-        print(f"\n  Contract:")
-        print(f"  4-Year Avg. Salary: ${player['salary']:,.0f}")
+        lines.append(f"\n  Contract:")
+        lines.append(f"  4-Year Avg. Salary: ${player['salary']:,.0f}")
 
-        print(f"\n  Production Analysis:")
-        print(f"  Actual Production: {player['production']:.1f}")
-        print(f"    (PIE {player['PIE']:.3f} × Minutes {player['MIN']:.0f})")
-        print(f"  Expected Production: {player['expected_production']:.1f}")
-        print(f"    (Based on historical rookies at ${player['salary']:,.0f} salary)")
+        lines.append(f"\n  Production Analysis:")
+        lines.append(f"  Actual Production: {player['production']:.1f}")
+        lines.append(f"    (PIE {player['PIE']:.3f} × Minutes {player['MIN']:.0f})")
+        lines.append(f"  Expected Production: {player['expected_production']:.1f}")
+        lines.append(f"    (Based on historical rookies at ${player['salary']:,.0f} salary)")
 
         residual = player['residual']
-        print(f"\n{'🟢' if residual > 0 else '🔴'} Residual Value: {residual:+.1f}")
+        lines.append(f"\n{'🟢' if residual > 0 else '🔴'} Residual Value: {residual:+.1f}")
 
         if residual > 0:
-            print(f"     SURPLUS: Producing {abs(residual):.1f} units more than expected")
-            print(f"     This rookie is outperforming their contract")
+            lines.append(f"     SURPLUS: Producing {abs(residual):.1f} units more than expected")
+            lines.append(f"     This rookie is outperforming their contract")
         else:
-            print(f"     DEFICIT: Producing {abs(residual):.1f} units less than expected")
-            print(f"     Historical rookies at this salary typically produce more")
+            lines.append(f"     DEFICIT: Producing {abs(residual):.1f} units less than expected")
+            lines.append(f"     Historical rookies at this salary typically produce more")
 
         # Context about their pick range
         if player['pick'] <= 3:
-            print(f"\n  Top-3 picks face extremely high expectations")
-            print(f"  Even great rookie seasons can show deficits at this salary level")
+            lines.append(f"\n  Top-3 picks face extremely high expectations")
+            lines.append(f"  Even great rookie seasons can show deficits at this salary level")
         elif player['pick'] <= 10:
-            print(f"\n  Lottery pick expectations are very high")
-            print(f"  Expected to be immediate contributors")
+            lines.append(f"\n  Lottery pick expectations are very high")
+            lines.append(f"  Expected to be immediate contributors")
         elif player['pick'] <= 30:
-            print(f"\n  First-round pick expectations are moderate")
+            lines.append(f"\n  First-round pick expectations are moderate")
         else:
-            print(f"\n  Second-round picks have low expectations")
-            print(f"  Easy to show surplus value at this price point")
+            lines.append(f"\n  Second-round picks have low expectations")
+            lines.append(f"  Easy to show surplus value at this price point")
 
         # Show historical comparisons if available
         if historical_df is not None:
-            print(f"\n  Historical Rookies at Similar Salary:")
+            lines.append(f"\n  Historical Rookies at Similar Salary:")
             salary = player['salary']
             # Find rookies within 5% of this salary
-            similar_salary = historical_df[
-                (historical_df['salary'] >= salary * 0.95) &
-                (historical_df['salary'] <= salary * 1.05)
-            ].sort_values('production', ascending=False)
-
-            if len(similar_salary) > 0:
-                print(f"    Found {len(similar_salary)} historical rookies around ${salary:,.0f} (±5%)")
-                print(f"    Their production:")
-                print(f"      Average: {similar_salary['production'].mean():.1f}")
-                print(f"      Median: {similar_salary['production'].median():.1f}")
-                print(f"      Range: {similar_salary['production'].min():.1f} - {similar_salary['production'].max():.1f}")
-
-                print(f"\n   Top performers at this salary:")
-                for i, (_, hist_player) in enumerate(similar_salary.head(5).iterrows()):
-                    if i >= 5:
-                        break
-                    print(f"     {hist_player['PLAYER_NAME']:20s} ({hist_player['SEASON']}) - {hist_player['production']:.1f}")
-
-                print(f"\n   {player['PLAYER_NAME']}'s production ({player['production']:.1f}) vs. historical average ({similar_salary['production'].mean():.1f})")
-                percentile = (similar_salary['production'] < player['production']).mean() * 100
-
-                print(f"   Ranks in {percentile:.0f}th percentile of historical rookies at this salary since {config.START_YEAR}")
-
-        print("\n  Interpreting Residuals")
-        print("    The residual reflects contract value, not absolute skill.")
-        print("    Negative residual means contract is expensive relative to production, while positive residual means production is exceeding expectation based on contract.")
-        print(f"    This doesn't necessarily assess {player['PLAYER_NAME']}'s skills!")
+            lo = np.searchsorted(hist_salaries, salary * 0.95, side='left')
+            hi = np.searchsorted(hist_salaries, salary * 1.05, side='right')
+            similar_production = hist_production[lo:hi]
+
+            if similar_production.size > 0:
+                similar_mean = similar_production.mean()
+                lines.append(f"    Found {similar_production.size} historical rookies around ${salary:,.0f} (±5%)")
+                lines.append(f"    Their production:")
+                lines.append(f"      Average: {similar_mean:.1f}")
+                lines.append(f"      Median: {np.median(similar_production):.1f}")
+                lines.append(f"      Range: {similar_production.min():.1f} - {similar_production.max():.1f}")
+
+                lines.append(f"\n   Top performers at this salary:")
+                top_performers = hist_sorted.iloc[lo:hi].nlargest(5, 'production')
+                for hist_player in top_performers.itertuples(index=False):
+                    lines.append(f"     {hist_player.PLAYER_NAME:20s} ({hist_player.SEASON}) - {hist_player.production:.1f}")
+
+                lines.append(f"\n   {player['PLAYER_NAME']}'s production ({player['production']:.1f}) vs. historical average ({similar_mean:.1f})")
+                percentile = (similar_production < player['production']).mean() * 100
+
+                lines.append(f"   Ranks in {percentile:.0f}th percentile of historical rookies at this salary since {config.START_YEAR}")
+
+        lines.append("\n  Interpreting Residuals")
+        lines.append("    The residual reflects contract value, not absolute skill.")
+        lines.append("    Negative residual means contract is expensive relative to production, while positive residual means production is exceeding expectation based on contract.")
+        lines.append(f"    This doesn't necessarily assess {player['PLAYER_NAME']}'s skills!")
 
         if residual < -50:
-            print(f"\n   Possible reasons for large deficit:")
-            print(f"     - Historical data includes generational outliers")
-            print(f"     - Player is injured or limited minutes")
-            print(f"     - Player is on bad team with poor supporting cast")
-            print(f"     - Rookie adjustment period (common for top picks)")
+            lines.append(f"\n   Possible reasons for large deficit:")
+            lines.append(f"     - Historical data includes generational outliers")
+            lines.append(f"     - Player is injured or limited minutes")
+            lines.append(f"     - Player is on bad team with poor supporting cast")
+            lines.append(f"     - Rookie adjustment period (common for top picks)")
+
+    if lines:
+        print('\n'.join(lines))
@@ -2,6 +2,7 @@
 
 import pandas as pd
 import numpy as np
+import os
 
 
 def calculate_residuals(current_df, pipeline):
@@ -12,7 +13,7 @@ def calculate_residuals(current_df, pipeline):
 
     Args:
         current_df: DataFrame with current season rookies
-        pipeline: Trained sklearn pipeline
+        pipeline: Trained sklearn model (anything with predict)
 
     Returns:
         DataFrame with residuals added
@@ -20,16 +21,15 @@ def calculate_residuals(current_df, pipeline):
     print("\nCalculating residuals...")
 
     # Make predictions
-    X = current_df[['salary']].values
+    X = current_df[['salary']].to_numpy(dtype=np.float64)
     expected_production = pipeline.predict(X)
 
-    # Calculate residuals
-    current_df = current_df.copy()
-    current_df['expected_production'] = expected_production
-    current_df['residual'] = current_df['production'] - current_df['expected_production']
-
-    # Sort by residual (highest surplus descending to greatest deficit)
-    current_df = current_df.sort_values('residual', ascending=False)
+    # Calculate residuals and sort (highest surplus descending to greatest deficit).
+    # assign/sort_values return new frames, so the caller's frame is untouched.
+    current_df = current_df.assign(
+        expected_production=expected_production,
+        residual=current_df['production'].to_numpy(dtype=np.float64) - expected_production
+    ).sort_values('residual', ascending=False)
 
     print(f"  Calculated residuals for {len(current_df)} rookies")
     print(f"  Top surplus: {current_df.iloc[0]['PLAYER_NAME']} (+{current_df.iloc[0]['residual']:.2f})")
@@ -40,7 +40,7 @@ def calculate_residuals(current_df, pipeline):
 
 def export_residuals(residuals_df, current_season, filepath=None):
     """
-    Export residuals to CSV.
+    Export residuals to CSV, with a Parquet copy alongside for fast reloads.
 
     Args:
         residuals_df: DataFrame with residuals
@@ -50,21 +50,21 @@ def export_residuals(residuals_df, current_season, filepath=None):
     if filepath is None:
         filepath = f'outputs/{current_season}_rookies_residuals.csv'
 
-    # Select key columns for export
+    # Select key columns and label them for export in one step (no separate copy + rename)
     export_df = residuals_df[[
         'PLAYER_NAME', 'team_abbrev', 'pick', 'salary',
         'GP', 'MIN', 'PIE', 'production',
         'expected_production', 'residual'
-    ]].copy()
-
-    # Rename columns
-    export_df.columns = [
+    ]].set_axis([
         'Player', 'Team', 'Pick', 'Salary',
         'Games', 'Minutes', 'PIE', 'Production',
         'Expected', 'Residual'
-    ]
+    ], axis=1)
+
+    # Save to CSV (same line endings on every platform)
+    export_df.to_csv(filepath, index=False, lineterminator='\n')
 
-    # Save to CSV
-    export_df.to_csv(filepath, index=False)
+    # Save to Parquet (keeps dtypes, loads without re-parsing text)
+    export_df.to_parquet(os.path.splitext(filepath)[0] + '.parquet', index=False)
 
     return export_df
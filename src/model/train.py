@@ -2,11 +2,9 @@
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import GradientBoostingRegressor
-from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.model_selection import cross_val_score
-from sklearn.pipeline import Pipeline
-import pickle
+import joblib
 import os
 from .. import config
 
@@ -22,8 +20,9 @@ def create_model(model_type):
         Sklearn model
     """
     if model_type == 'gradient_boosting':
-        return GradientBoostingRegressor(
-            n_estimators=100,
+        # Histogram-based boosting: bins the feature once, much faster to fit
+        return HistGradientBoostingRegressor(
+            max_iter=100,
             max_depth=4,
             learning_rate=0.1,
             random_state=42
@@ -40,31 +39,27 @@ def train_model(historical_df):
         historical_df: DataFrame with historical rookies (must have 'salary' and 'production')
 
     Returns:
-        Trained pipeline (scaler + model)
+        Trained model
     """
     print("\nTraining regression model...")
     print(f"  Model type: {config.MODEL_TYPE}")
     print(f"  CV folds: {config.CROSS_VALIDATION_FOLDS}")
 
     # Prepare features and target
-    X = historical_df[['salary']].values
-    y = historical_df['production'].values
+    X = historical_df[['salary']].to_numpy(dtype=np.float64)
+    y = historical_df['production'].to_numpy(dtype=np.float64)
 
     print(f"  Training data: {len(X)} rookies")
     print(f"  Average salary range: ${X.min():,.0f} - ${X.max():,.0f}")
     print(f"  Production range: {y.min():.2f} - {y.max():.2f}")
 
-    # Create pipeline with scaling
+    # Tree splits are scale-invariant, so salary is used unscaled
     model = create_model(config.MODEL_TYPE)
-    pipeline = Pipeline([
-        ('scaler', StandardScaler()),
-        ('regressor', model)
-    ])
 
     # Cross-validation
     print(f"\nPerforming {config.CROSS_VALIDATION_FOLDS}-fold cross-validation...")
     cv_scores = cross_val_score(
-        pipeline, X, y,
+        model, X, y,
         cv=config.CROSS_VALIDATION_FOLDS,
         scoring='r2',
         n_jobs=1
@@ -75,22 +70,22 @@ def train_model(historical_df):
 
     # Train final model on all data
     print("\nTraining model on all historical data...")
-    pipeline.fit(X, y)
+    model.fit(X, y)
 
     print("  Model training complete")
 
-    return pipeline
+    return model
 
 
 def save_model(pipeline, filepath='outputs/model.pkl'):
     """Save trained model to disk."""
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'wb') as f:
-        pickle.dump(pipeline, f)
+    # joblib stores the model's NumPy arrays as compressed raw buffers
+    joblib.dump(pipeline, filepath, compress=3)
 
 
 def load_model(filepath='outputs/model.pkl'):
     """Load trained model from disk."""
-    with open(filepath, 'rb') as f:
-        pipeline = pickle.load(f)
+    # Also reads models saved with plain pickle by older versions
+    pipeline = joblib.load(filepath)
     return pipeline